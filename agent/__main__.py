@@ -578,9 +578,9 @@ def _apply_runtime_overrides(cfg: AgentConfig, args: argparse.Namespace, creds:
 
 
 def run_plain_repl(ctx: ChatContext) -> None:
-    from .demo import DemoCensor
+    from .demo import get_censor
 
-    censor_fn = DemoCensor(ctx.cfg.workspace).censor_text if ctx.cfg.demo else None
+    censor_fn = get_censor(ctx.cfg.workspace).censor_text if ctx.cfg.demo else None
 
     def _out(text: str) -> None:
         print(censor_fn(text) if censor_fn else text)
@@ -1118,8 +1118,8 @@ def main() -> None:
     # Build optional censor for headless / plain text paths.
     censor_fn = None
     if cfg.demo:
-        from .demo import DemoCensor
-        censor_fn = DemoCensor(cfg.workspace).censor_text
+        from .demo import get_censor
+        censor_fn = get_censor(cfg.workspace).censor_text
 
     def _print_startup(info: dict[str, str]) -> None:
         for key, val in info.items():
@@ -10,8 +10,9 @@ rather than regex post-processing.
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
-from typing import Any, Sequence
+from typing import Any, Callable, Sequence
 
 # Generic path components that should NOT be censored.
 _GENERIC_PATH_PARTS: frozenset[str] = frozenset({
@@ -22,6 +23,12 @@ _GENERIC_PATH_PARTS: frozenset[str] = frozenset({
 })
 
 
+@functools.lru_cache(maxsize=256)
+def _block(n: int) -> str:
+    """Return a run of *n* block characters, shared across callers."""
+    return "\u2588" * n
+
+
 # ---------------------------------------------------------------------------
 # DemoCensor
 # ---------------------------------------------------------------------------
@@ -30,7 +37,8 @@ class DemoCensor:
     """Builds replacement tables from a workspace path and censors text."""
 
     def __init__(self, workspace: Path) -> None:
-        self._replacements: list[tuple[str, str]] = []
+        self._map: dict[str, str] = {}
+        self._originals: list[str] = []
         self._build_path_replacements(workspace)
 
     # -- construction helpers ------------------------------------------------
@@ -38,38 +46,82 @@ class DemoCensor:
     def _build_path_replacements(self, workspace: Path) -> None:
         """Decompose *workspace* into parts; add non-generic, non-project
         segments to the literal replacement table."""
-        project_name = workspace.name
-        for part in workspace.parts:
+        # Plain string split: no pathlib traversal, and both separators are
+        # handled.  Repeated parts collapse into one entry of ``self._map``.
+        parts = [p for p in str(workspace).replace("\\", "/").split("/") if p]
+        # A Windows drive ("C:") is an anchor, not a segment: censoring it
+        # would also hit every "X:" elsewhere in the text.
+        if parts and parts[0].endswith(":"):
+            del parts[0]
+        project_name = parts[-1] if parts else ""
+        for part in parts:
             if part in _GENERIC_PATH_PARTS:
                 continue
             if part == project_name:
                 continue
-            if not part:  # empty string guard
-                continue
-            replacement = "\u2588" * len(part)
-            self._replacements.append((part, replacement))
+            self._map[part] = _block(len(part))
 
         # Sort longest-first so longer matches take precedence.
-        self._replacements.sort(key=lambda t: len(t[0]), reverse=True)
+        self._originals = sorted(self._map, key=len, reverse=True)
 
     # -- public API ----------------------------------------------------------
 
     def censor_text(self, text: str) -> str:
-        """Apply workspace-path segment replacements."""
-        for original, replacement in self._replacements:
-            text = text.replace(original, replacement)
-        return text
+        """Apply workspace-path segment replacements.
+
+        Returns the input object itself when nothing matched.
+        """
+        return self.censor_text_with_flag(text)[0]
+
+    def censor_text_with_flag(self, text: str) -> tuple[str, bool]:
+        """Return ``(censored, changed)`` for *text*.
+
+        *changed* is true when any segment matched; otherwise *censored* is
+        the input object itself.
+        """
+        # One C-level substring scan per segment; replace only on a hit.
+        # Real workspaces yield only a handful of segments, so this beats
+        # any single-pass multi-pattern matcher driven from Python.
+        changed = False
+        for original in self._originals:
+            if original in text:
+                text = text.replace(original, self._map[original])
+                changed = True
+        return text, changed
 
     def censor_rich_text(self, rich_text: Any) -> Any:
         """Censor a ``rich.text.Text`` object in-place (same length preserves
         style spans) and return it."""
         original = rich_text.plain
-        censored = self.censor_text(original)
-        if censored != original:
-            rich_text.plain = censored
+        if not original:
+            return rich_text
+        censored, changed = self.censor_text_with_flag(original)
+        if not changed:
+            return rich_text
+        # Reading ``plain`` collapses Text's fragments into one; swap it
+        # directly to skip the setter's compare and control-code strip (the
+        # text was already sanitized and only block characters were added).
+        try:
+            fragments = rich_text._text
+            if len(fragments) == 1:
+                fragments[0] = censored
+                return rich_text
+        except (AttributeError, TypeError):
+            pass
+        rich_text.plain = censored
         return rich_text
 
 
+@functools.lru_cache(maxsize=32)
+def get_censor(workspace: Path) -> DemoCensor:
+    """Return a shared :class:`DemoCensor` for *workspace*.
+
+    A censor is immutable after construction, so every caller for the same
+    workspace can share one.
+    """
+    return DemoCensor(workspace)
+
+
 # ---------------------------------------------------------------------------
 # DemoRenderHook — intercept all Rich renderables before display
 # ---------------------------------------------------------------------------
@@ -78,7 +130,20 @@ class DemoRenderHook:
     """A ``rich.console.RenderHook`` that censors renderables before display."""
 
     def __init__(self, censor: DemoCensor) -> None:
+        # Lazy imports so the module loads even without Rich installed; done
+        # once here rather than per renderable.
+        from rich.text import Text
+        from rich.markdown import Markdown
+        from rich.rule import Rule
+
         self._censor = censor
+        self._markdown_cls = Markdown
+        self._dispatch: dict[type, Callable[[Any], Any]] = {
+            Text: censor.censor_rich_text,
+            Markdown: self._process_markdown,
+            Rule: self._process_rule,
+        }
+        self._rich_types: tuple[type, ...] = tuple(self._dispatch)
 
     # -- RenderHook protocol -------------------------------------------------
 
@@ -90,21 +155,42 @@ class DemoRenderHook:
     # -- per-renderable dispatch ---------------------------------------------
 
     def _process_one(self, renderable: Any) -> Any:
-        # Lazy imports so the module loads even without Rich installed.
-        from rich.text import Text
-        from rich.markdown import Markdown
-        from rich.rule import Rule
-
-        if isinstance(renderable, Text):
-            return self._censor.censor_rich_text(renderable)
-
-        if isinstance(renderable, Markdown):
-            new_markup = self._censor.censor_text(renderable.markup)
-            return Markdown(new_markup)
-
-        if isinstance(renderable, Rule):
-            if renderable.title:
-                renderable.title = self._censor.censor_text(renderable.title)
+        handler = self._dispatch.get(type(renderable))
+        if handler is None:
+            if not isinstance(renderable, self._rich_types):
+                return renderable
+            # Subclass of a handled type: resolve through the MRO.
+            handler = next(
+                self._dispatch[cls]
+                for cls in type(renderable).__mro__
+                if cls in self._dispatch
+            )
+        return handler(renderable)
+
+    def _process_markdown(self, renderable: Any) -> Any:
+        # Markdown renders from its parsed tokens, so censored markup must be
+        # re-parsed -- but only when censoring actually changed something.
+        new_markup, changed = self._censor.censor_text_with_flag(renderable.markup)
+        if not changed:
             return renderable
-
+        return self._markdown_cls(
+            new_markup,
+            code_theme=renderable.code_theme,
+            justify=renderable.justify,
+            style=renderable.style,
+            hyperlinks=renderable.hyperlinks,
+            inline_code_lexer=renderable.inline_code_lexer,
+            inline_code_theme=renderable.inline_code_theme,
+        )
+
+    def _process_rule(self, renderable: Any) -> Any:
+        title = renderable.title
+        if not title:
+            return renderable
+        if isinstance(title, str):
+            new_title, changed = self._censor.censor_text_with_flag(title)
+            if changed:
+                renderable.title = new_title
+        else:
+            self._censor.censor_rich_text(title)
         return renderable
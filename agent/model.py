@@ -9,6 +9,11 @@ from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 from typing import Any, Callable, Protocol
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 from .config import strip_foundry_model_prefix
 from .tool_defs import TOOL_DEFINITIONS, to_anthropic_tools, to_openai_tools
 
@@ -250,6 +255,16 @@ def _raise_sse_error(data_dict: dict[str, Any]) -> None:
         raise ModelError(f"Stream error: {err_msg}")
 
 
+def _encode_json_body(payload: dict[str, Any]) -> bytes:
+    """Serialize a request body straight to UTF-8 bytes, via orjson if installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload)
+        except orjson.JSONEncodeError:
+            pass  # e.g. ints beyond 64 bits; stdlib json handles these
+    return json.dumps(payload).encode("utf-8")
+
+
 def _http_json(
     url: str,
     method: str,
@@ -259,7 +274,7 @@ def _http_json(
 ) -> dict[str, Any]:
     req = urllib.request.Request(
         url=url,
-        data=(json.dumps(payload).encode("utf-8") if payload is not None else None),
+        data=(_encode_json_body(payload) if payload is not None else None),
         headers=headers,
         method=method,
     )
@@ -294,37 +309,55 @@ def _extend_socket_timeout(resp: Any, timeout: float) -> None:
         pass
 
 
+def _parse_sse_data(data: bytes) -> Any:
+    """Decode one SSE ``data`` payload, preferring orjson when installed."""
+    try:
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+    except ValueError:
+        pass
+    # Invalid UTF-8 (e.g. a provider splitting a multi-byte character) makes
+    # both parsers reject the raw bytes; decode leniently and retry so the
+    # event keeps its structure instead of degrading to ``_raw``.
+    text = data.decode("utf-8", errors="replace")
+    try:
+        return json.loads(text)
+    except ValueError:
+        return {"_raw": text}
+
+
 def _read_sse_events(
     resp: Any,
     on_sse_event: "Callable[[str, dict[str, Any]], None] | None" = None,
 ) -> list[tuple[str, dict[str, Any]]]:
-    """Read SSE lines from an HTTP response, returning (event_type, data_dict) pairs."""
+    """Read SSE lines from an HTTP response, returning (event_type, data_dict) pairs.
+
+    Lines are handled as raw bytes; only event names are decoded, and data
+    payloads go to the JSON parser without an intermediate ``str``.
+    """
     events: list[tuple[str, dict[str, Any]]] = []
     current_event = ""
-    current_data_lines: list[str] = []
+    current_data_lines: list[bytes] = []
 
     for raw_line in resp:
-        line = raw_line.decode("utf-8", errors="replace").rstrip("\r\n")
+        line = raw_line.rstrip(b"\r\n")
 
-        if line.startswith("event:"):
-            current_event = line[len("event:"):].strip()
+        if line.startswith(b"event:"):
+            current_event = line[len(b"event:"):].strip().decode("utf-8", errors="replace")
             continue
 
-        if line.startswith("data:"):
-            data_str = line[len("data:"):].strip()
-            if data_str == "[DONE]":
+        if line.startswith(b"data:"):
+            data = line[len(b"data:"):].strip()
+            if data == b"[DONE]":
                 break
-            current_data_lines.append(data_str)
+            current_data_lines.append(data)
             continue
 
         # Empty line = end of SSE message
         if not line:
             if current_data_lines:
-                joined = "\n".join(current_data_lines)
-                try:
-                    data_dict = json.loads(joined)
-                except json.JSONDecodeError:
-                    data_dict = {"_raw": joined}
+                data_dict = _parse_sse_data(b"\n".join(current_data_lines))
                 if isinstance(data_dict, dict):
                     _raise_sse_error(data_dict)
                     events.append((current_event, data_dict))
@@ -339,11 +372,7 @@ def _read_sse_events(
 
     # Flush any remaining data (some servers don't end with empty line)
     if current_data_lines:
-        joined = "\n".join(current_data_lines)
-        try:
-            data_dict = json.loads(joined)
-        except json.JSONDecodeError:
-            data_dict = {"_raw": joined}
+        data_dict = _parse_sse_data(b"\n".join(current_data_lines))
         if isinstance(data_dict, dict):
             _raise_sse_error(data_dict)
             events.append((current_event, data_dict))
@@ -367,7 +396,7 @@ def _http_stream_sse(
     on_sse_event: "Callable[[str, dict[str, Any]], None] | None" = None,
 ) -> list[tuple[str, dict[str, Any]]]:
     """Stream an SSE endpoint with first-byte timeout and retry logic."""
-    data = json.dumps(payload).encode("utf-8")
+    data = _encode_json_body(payload)
 
     last_exc: Exception | None = None
     for attempt in range(max_retries):
@@ -791,6 +820,9 @@ class OpenAICompatibleModel:
     on_content_delta: Callable[[str, str], None] | None = None
     provider: str | None = None
     stream_max_retries: int = 3
+    _base_payload_cache: tuple[tuple[Any, ...], dict[str, Any]] | None = field(
+        default=None, init=False, repr=False, compare=False,
+    )
 
     def _request_model_name(self) -> str:
         return strip_foundry_model_prefix(self.model)
@@ -816,33 +848,53 @@ class OpenAICompatibleModel:
         ]
         return Conversation(_provider_messages=messages, system_prompt=system_prompt)
 
-    def complete(self, conversation: Conversation) -> ModelTurn:
-        is_reasoning = self._is_reasoning_model()
+    def _base_payload(self) -> dict[str, Any]:
+        """Return the conversation-independent request fields.
 
-        payload: dict[str, Any] = {
+        Built once and reused across turns; rebuilt only when one of the
+        fields it is derived from changes (e.g. the engine swaps ``tool_defs``).
+        Callers must copy before mutating.
+        """
+        key = (
+            self.model, self.tool_defs, self.strict_tools, self.temperature,
+            self.reasoning_effort, self.thinking_type,
+        )
+        cached = self._base_payload_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        base: dict[str, Any] = {
             "model": self._request_model_name(),
-            "messages": conversation._provider_messages,
             "tools": to_openai_tools(defs=self.tool_defs, strict=self.strict_tools),
             "tool_choice": "auto",
             "stream": True,
             "stream_options": {"include_usage": True},
         }
 
-        if conversation.stop_sequences:
-            payload["stop"] = conversation.stop_sequences
-
         # Reasoning models (o-series) don't support temperature.
-        if not is_reasoning:
-            payload["temperature"] = self.temperature
+        if not self._is_reasoning_model():
+            base["temperature"] = self.temperature
 
         # Chat Completions API uses flat `reasoning_effort` (not the nested
         # `reasoning: {effort: ...}` format which is for the Responses API).
         effort = (self.reasoning_effort or "").strip().lower()
         if effort:
-            payload["reasoning_effort"] = effort
+            base["reasoning_effort"] = effort
         thinking_type = (self.thinking_type or "").strip().lower()
         if thinking_type in {"enabled", "disabled"}:
-            payload["thinking"] = {"type": thinking_type}
+            base["thinking"] = {"type": thinking_type}
+
+        self._base_payload_cache = (key, base)
+        return base
+
+    def complete(self, conversation: Conversation) -> ModelTurn:
+        effort = (self.reasoning_effort or "").strip().lower()
+        payload: dict[str, Any] = {
+            **self._base_payload(),
+            "messages": conversation._provider_messages,
+        }
+        if conversation.stop_sequences:
+            payload["stop"] = conversation.stop_sequences
 
         headers = {
             "Authorization": f"Bearer {self.api_key}",
@@ -903,14 +955,15 @@ class OpenAICompatibleModel:
         try:
             parsed = _request_stream(payload, self.base_url)
         except ModelError as exc:
+            if not effort:
+                raise
             text = str(exc).lower()
-            unsupported_reasoning = effort and (
-                "reasoning_effort" in text
-                and ("unsupported_parameter" in text or "unknown" in text)
+            unsupported_reasoning = "reasoning_effort" in text and (
+                "unsupported_parameter" in text or "unknown" in text
             )
             if not unsupported_reasoning:
                 raise
-            payload = dict(payload)
+            # payload is a per-call copy of the base template; edit in place.
             payload.pop("reasoning_effort", None)
             parsed = _request_stream(payload, self.base_url)
 
@@ -1031,6 +1084,9 @@ class AnthropicModel:
     timeout_sec: int = 300
     tool_defs: list[dict[str, Any]] | None = None
     on_content_delta: Callable[[str, str], None] | None = None
+    _base_payload_cache: tuple[tuple[Any, ...], dict[str, Any]] | None = field(
+        default=None, init=False, repr=False, compare=False,
+    )
 
     def _request_model_name(self) -> str:
         return strip_foundry_model_prefix(self.model)
@@ -1045,35 +1101,56 @@ class AnthropicModel:
         lower = self._request_model_name().lower()
         return "opus-4-6" in lower or "opus-4.6" in lower
 
-    def complete(self, conversation: Conversation) -> ModelTurn:
-        effort = (self.reasoning_effort or "").strip().lower()
-        use_thinking = effort in {"low", "medium", "high"}
+    def _base_payload(self) -> dict[str, Any]:
+        """Return the conversation-independent request fields.
 
-        payload: dict[str, Any] = {
+        Built once and reused across turns; rebuilt only when one of the
+        fields it is derived from changes (e.g. the engine swaps ``tool_defs``).
+        Callers must copy before mutating.
+        """
+        key = (
+            self.model, self.max_tokens, self.tool_defs, self.temperature,
+            self.reasoning_effort,
+        )
+        cached = self._base_payload_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        effort = (self.reasoning_effort or "").strip().lower()
+        base: dict[str, Any] = {
             "model": self._request_model_name(),
             "max_tokens": self.max_tokens,
-            "messages": conversation._provider_messages,
             "tools": to_anthropic_tools(defs=self.tool_defs),
             "stream": True,
         }
 
+        # Thinking is incompatible with temperature — omit it entirely.
+        if effort not in {"low", "medium", "high"}:
+            base["temperature"] = self.temperature
+        elif self._is_opus_46():
+            # Opus 4.6: adaptive thinking (manual mode deprecated).
+            base["thinking"] = {"type": "adaptive"}
+            base["output_config"] = {"effort": effort}
+        else:
+            # Older models: manual thinking with explicit budget.
+            budget = {"low": 1024, "medium": 4096, "high": 8192}[effort]
+            if base["max_tokens"] <= budget:
+                base["max_tokens"] = budget + 8192
+            base["thinking"] = {"type": "enabled", "budget_tokens": budget}
+
+        self._base_payload_cache = (key, base)
+        return base
+
+    def complete(self, conversation: Conversation) -> ModelTurn:
+        effort = (self.reasoning_effort or "").strip().lower()
+        use_thinking = effort in {"low", "medium", "high"}
+
+        payload: dict[str, Any] = {
+            **self._base_payload(),
+            "messages": conversation._provider_messages,
+        }
         if conversation.stop_sequences:
             payload["stop_sequences"] = conversation.stop_sequences
-
-        # Thinking is incompatible with temperature — omit it entirely.
-        if not use_thinking:
-            payload["temperature"] = self.temperature
-        if use_thinking:
-            if self._is_opus_46():
-                # Opus 4.6: adaptive thinking (manual mode deprecated).
-                payload["thinking"] = {"type": "adaptive"}
-                payload["output_config"] = {"effort": effort}
-            else:
-                # Older models: manual thinking with explicit budget.
-                budget = {"low": 1024, "medium": 4096, "high": 8192}[effort]
-                if payload["max_tokens"] <= budget:
-                    payload["max_tokens"] = budget + 8192
-                payload["thinking"] = {"type": "enabled", "budget_tokens": budget}
         if conversation.system_prompt:
             payload["system"] = conversation.system_prompt
 
@@ -1127,14 +1204,15 @@ class AnthropicModel:
             )
             parsed = _accumulate_anthropic_stream(events)
         except ModelError as exc:
+            if not use_thinking:
+                raise
             text = str(exc).lower()
-            unsupported_thinking = use_thinking and (
-                "thinking" in text
-                and ("unknown" in text or "unsupported" in text or "invalid" in text)
+            unsupported_thinking = "thinking" in text and (
+                "unknown" in text or "unsupported" in text or "invalid" in text
             )
             if not unsupported_thinking:
                 raise
-            payload = dict(payload)
+            # payload is a per-call copy of the base template; edit in place.
             payload.pop("thinking", None)
             payload.pop("output_config", None)
             events = _http_stream_sse(
@@ -6,6 +6,8 @@ intentionally different tool or recursion behavior.
 """
 from __future__ import annotations
 
+import itertools
+
 
 SYSTEM_PROMPT_BASE = """\
 You are Cestus, an analysis and investigation agent operating through a terminal session.
@@ -576,10 +578,10 @@ For EVERY investigation, you MUST maintain the wiki as a living knowledge map:
 """
 
 
-def build_system_prompt(
+def _assemble_system_prompt(
     recursive: bool,
-    acceptance_criteria: bool = False,
-    demo: bool = False,
+    acceptance_criteria: bool,
+    demo: bool,
 ) -> str:
     """Assemble the system prompt, including recursion sections only when enabled."""
     prompt = SYSTEM_PROMPT_BASE
@@ -596,3 +598,19 @@ def build_system_prompt(
     if demo:
         prompt += DEMO_SECTION
     return prompt
+
+
+# Every flag combination, assembled once at import.
+_PROMPT_VARIANTS: dict[tuple[bool, bool, bool], str] = {
+    flags: _assemble_system_prompt(*flags)
+    for flags in itertools.product((False, True), repeat=3)
+}
+
+
+def build_system_prompt(
+    recursive: bool,
+    acceptance_criteria: bool = False,
+    demo: bool = False,
+) -> str:
+    """Return the precomputed system prompt variant for the given flags."""
+    return _PROMPT_VARIANTS[(bool(recursive), bool(acceptance_criteria), bool(demo))]
@@ -410,8 +410,8 @@ class CestusApp(App):
         # Demo mode censor
         self._censor_fn = None
         if ctx.cfg.demo:
-            from .demo import DemoCensor
-            self._censor_fn = DemoCensor(ctx.cfg.workspace).censor_text
+            from .demo import get_censor
+            self._censor_fn = get_censor(ctx.cfg.workspace).censor_text
 
     def _resolve_wiki_dir(self) -> Path | None:
         """Find the wiki directory for graph display.
@@ -1258,8 +1258,8 @@ class RichREPL:
         censor_fn = None
         self._demo_hook = None
         if ctx.cfg.demo:
-            from .demo import DemoCensor, DemoRenderHook
-            censor = DemoCensor(ctx.cfg.workspace)
+            from .demo import DemoRenderHook, get_censor
+            censor = get_censor(ctx.cfg.workspace)
             censor_fn = censor.censor_text
             self._demo_hook = DemoRenderHook(censor)
 
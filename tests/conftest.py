@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from typing import Any
 
 from agent.model import ToolCall
@@ -99,7 +100,6 @@ def _anthropic_dict_to_events(
                 }))
 
             elif btype == "tool_use":
-                import json as _json
                 events.append(("content_block_start", {
                     "type": "content_block_start",
                     "index": i,
@@ -116,7 +116,7 @@ def _anthropic_dict_to_events(
                         "index": i,
                         "delta": {
                             "type": "input_json_delta",
-                            "partial_json": _json.dumps(inp),
+                            "partial_json": json.dumps(inp),
                         },
                     }))
                 events.append(("content_block_stop", {
@@ -5,7 +5,7 @@ from __future__ import annotations
 import unittest
 from pathlib import Path
 
-from agent.demo import DemoCensor, DemoRenderHook
+from agent.demo import DemoCensor, DemoRenderHook, get_censor
 
 
 class DemoCensorPathTests(unittest.TestCase):
@@ -43,6 +43,42 @@ class DemoCensorPathTests(unittest.TestCase):
         self.assertIn("\u2588" * 3, result)
         self.assertEqual(len(text), len(result))
 
+    def test_repeated_segments_all_censored(self) -> None:
+        ws = Path("/home/alice/alice_org/Proj")
+        c = DemoCensor(ws)
+        text = "alice_org and alice, then /home/alice/alice_org/Proj"
+        result = c.censor_text(text)
+        self.assertNotIn("alice", result)
+        self.assertEqual(len(text), len(result))
+        self.assertIn(" and ", result)
+        self.assertIn("Proj", result)
+
+    def test_windows_separators_split(self) -> None:
+        c = DemoCensor(Path("C:\\Users\\carol\\Proj"))
+        result = c.censor_text("C:\\Users\\carol\\Proj")
+        self.assertNotIn("carol", result)
+        self.assertIn("Users", result)
+        self.assertIn("Proj", result)
+        # The drive is not a segment, so "X:" elsewhere is left alone.
+        self.assertTrue(result.startswith("C:\\"))
+        text = "ABC: status OK; see C:/tmp"
+        self.assertIs(c.censor_text(text), text)
+
+
+class GetCensorTests(unittest.TestCase):
+    """get_censor shares one DemoCensor per workspace."""
+
+    def test_same_workspace_returns_same_instance(self) -> None:
+        a = get_censor(Path("/Users/erin/Documents/Proj"))
+        b = get_censor(Path("/Users/erin/Documents/Proj"))
+        self.assertIs(a, b)
+        self.assertNotIn("erin", a.censor_text("/Users/erin/Documents/Proj"))
+
+    def test_different_workspaces_get_different_instances(self) -> None:
+        a = get_censor(Path("/Users/erin/Documents/Proj"))
+        b = get_censor(Path("/Users/frank/Documents/Proj"))
+        self.assertIsNot(a, b)
+
 
 class DemoCensorEdgeCases(unittest.TestCase):
     """Empty and plain text edge cases."""
@@ -58,6 +94,21 @@ class DemoCensorEdgeCases(unittest.TestCase):
         text = "this is all lowercase and has no path segments"
         self.assertEqual(c.censor_text(text), text)
 
+    def test_unchanged_text_returned_as_same_object(self) -> None:
+        ws = Path("/Users/bob/Documents/Proj")
+        c = DemoCensor(ws)
+        text = "Documents only, nothing secret"
+        self.assertIs(c.censor_text(text), text)
+
+    def test_censor_text_with_flag_reports_change(self) -> None:
+        ws = Path("/Users/bob/Documents/Proj")
+        c = DemoCensor(ws)
+        censored, changed = c.censor_text_with_flag("cd /Users/bob/Documents/Proj")
+        self.assertTrue(changed)
+        self.assertNotIn("bob", censored)
+        text = "Documents only, nothing secret"
+        self.assertEqual(c.censor_text_with_flag(text), (text, False))
+
     def test_entity_names_not_censored_by_censor_text(self) -> None:
         """Entity censoring is handled by the prompt, not DemoCensor."""
         ws = Path("/tmp/Proj")
@@ -105,6 +156,19 @@ class DemoCensorRichTextTests(unittest.TestCase):
         # Style span should still exist
         self.assertTrue(any("bold" in str(span) for span in t._spans))
 
+    def test_rich_text_multi_fragment_censored(self) -> None:
+        from rich.text import Text
+
+        ws = Path("/Users/alice/Documents/Proj")
+        c = DemoCensor(ws)
+        t = Text("cd /Users/")
+        t.append("alice", style="bold")
+        t.append("/Documents/Proj")
+        c.censor_rich_text(t)
+        self.assertNotIn("alice", t.plain)
+        self.assertEqual(len(t), len("cd /Users/alice/Documents/Proj"))
+        self.assertTrue(any("bold" in str(span) for span in t._spans))
+
     def test_rich_text_unchanged_when_no_match(self) -> None:
         from rich.text import Text
 
@@ -134,6 +198,16 @@ class DemoRenderHookTests(unittest.TestCase):
         self.assertNotIn("jdoe", results[0].plain)
         self.assertIn("Users", results[0].plain)
 
+    def test_text_subclass_censored(self) -> None:
+        from rich.text import Text
+
+        class LogText(Text):
+            pass
+
+        hook = self._make_hook()
+        results = hook.process_renderables([LogText("/Users/jdoe/Documents/Proj")])
+        self.assertNotIn("jdoe", results[0].plain)
+
     def test_markdown_censored(self) -> None:
         from rich.markdown import Markdown
 
@@ -144,6 +218,24 @@ class DemoRenderHookTests(unittest.TestCase):
         self.assertIsInstance(results[0], Markdown)
         self.assertNotIn("jdoe", results[0].markup)
 
+    def test_markdown_without_match_not_reparsed(self) -> None:
+        from rich.markdown import Markdown
+
+        hook = self._make_hook()
+        md = Markdown("nothing sensitive here")
+        results = hook.process_renderables([md])
+        self.assertIs(results[0], md)
+
+    def test_markdown_options_preserved(self) -> None:
+        from rich.markdown import Markdown
+
+        hook = self._make_hook()
+        md = Markdown("/Users/jdoe/Documents/Proj", code_theme="native", hyperlinks=False)
+        result = hook.process_renderables([md])[0]
+        self.assertNotIn("jdoe", result.markup)
+        self.assertEqual(result.code_theme, "native")
+        self.assertFalse(result.hyperlinks)
+
     def test_rule_censored(self) -> None:
         from rich.rule import Rule
 
@@ -154,6 +246,15 @@ class DemoRenderHookTests(unittest.TestCase):
         self.assertIsInstance(results[0], Rule)
         self.assertNotIn("jdoe", results[0].title)
 
+    def test_rule_text_title_censored(self) -> None:
+        from rich.rule import Rule
+        from rich.text import Text
+
+        hook = self._make_hook()
+        r = Rule(title=Text("Step 1 /Users/jdoe/Documents/Proj"))
+        results = hook.process_renderables([r])
+        self.assertNotIn("jdoe", results[0].title.plain)
+
     def test_other_renderable_passes_through(self) -> None:
         hook = self._make_hook()
         obj = {"arbitrary": "object"}
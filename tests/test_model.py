@@ -190,6 +190,10 @@ class ModelPayloadTests(unittest.TestCase):
             self.assertEqual(turn.text, "ok")
             self.assertIn("reasoning_effort", calls[0])
             self.assertNotIn("reasoning_effort", calls[1])
+            # The retry must not leak into later turns.
+            calls.clear()
+            model.complete(conv)
+            self.assertIn("reasoning_effort", calls[0])
 
     def test_anthropic_retries_without_thinking_when_unsupported(self) -> None:
         calls: list[dict] = []
@@ -219,6 +223,31 @@ class ModelPayloadTests(unittest.TestCase):
             self.assertIn("thinking", calls[0])
             self.assertNotIn("thinking", calls[1])
 
+    def test_base_payload_reused_until_tool_defs_change(self) -> None:
+        payloads: list[dict] = []
+
+        def fake_http_json(url, method, headers, payload=None, timeout_sec=90):  # type: ignore[no-untyped-def]
+            payloads.append(payload)
+            return {
+                "choices": [
+                    {
+                        "message": {"content": "ok", "tool_calls": None},
+                        "finish_reason": "stop",
+                    }
+                ]
+            }
+
+        with patch("agent.model._http_stream_sse", mock_openai_stream(fake_http_json)):
+            model = OpenAICompatibleModel(model="gpt-4.1-mini", api_key="k")
+            conv = model.create_conversation("system", "user msg")
+            model.complete(conv)
+            model.complete(conv)
+            model.tool_defs = []
+            model.complete(conv)
+        self.assertIs(payloads[0]["tools"], payloads[1]["tools"])
+        self.assertEqual(payloads[2]["tools"], [])
+        self.assertIs(payloads[0]["messages"], conv._provider_messages)
+
     def test_openai_reasoning_content_forwards_as_thinking(self) -> None:
         deltas: list[tuple[str, str]] = []
 
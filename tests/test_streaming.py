@@ -99,6 +99,38 @@ class ReadSSEEventsTests(unittest.TestCase):
         events = _read_sse_events(resp)
         self.assertEqual(len(events), 1)
 
+    def test_crlf_lines_and_stdlib_json_fallback(self) -> None:
+        raw = (
+            b'event: ping\r\n'
+            b'data: {"type":"ping","text":"caf\xc3\xa9"}\r\n'
+            b'\r\n'
+        )
+        for backend in ("default", None):
+            with self.subTest(backend=backend):
+                if backend is None:
+                    with patch("agent.model.orjson", None):
+                        events = _read_sse_events(io.BytesIO(raw))
+                else:
+                    events = _read_sse_events(io.BytesIO(raw))
+                self.assertEqual(events, [("ping", {"type": "ping", "text": "caf\u00e9"})])
+
+    def test_invalid_utf8_json_still_parsed(self) -> None:
+        raw = b'data: {"choices":[{"delta":{"content":"ok \xff"}}]}\n\n'
+        expected = [("", {"choices": [{"delta": {"content": "ok \ufffd"}}]})]
+        for backend in ("default", None):
+            with self.subTest(backend=backend):
+                if backend is None:
+                    with patch("agent.model.orjson", None):
+                        events = _read_sse_events(io.BytesIO(raw))
+                else:
+                    events = _read_sse_events(io.BytesIO(raw))
+                self.assertEqual(events, expected)
+
+    def test_non_json_data_kept_raw(self) -> None:
+        resp = self._make_resp(['data: not json', ''])
+        events = _read_sse_events(resp)
+        self.assertEqual(events, [("", {"_raw": "not json"})])
+
 
 class AccumulateOpenAIStreamTests(unittest.TestCase):
     """Test _accumulate_openai_stream."""
@@ -206,6 +238,23 @@ class AccumulateAnthropicStreamTests(unittest.TestCase):
 class HttpStreamSSETests(unittest.TestCase):
     """Test _http_stream_sse retry and error handling."""
 
+    def test_request_body_is_json_bytes(self) -> None:
+        sent: list[bytes] = []
+        payload = {"model": "m", "messages": [{"role": "user", "content": "h\u00e9"}], "n": 2**70}
+
+        def fake_urlopen(req, timeout=None):
+            sent.append(req.data)
+            resp = MagicMock()
+            resp.__iter__ = lambda self: iter([b'data: {"ok":true}', b""])
+            return resp
+
+        with patch("agent.model.urllib.request.urlopen", fake_urlopen):
+            _http_stream_sse("http://x", "POST", {}, {"model": "m"})
+            _http_stream_sse("http://x", "POST", {}, payload)
+        self.assertIsInstance(sent[0], bytes)
+        self.assertEqual(json.loads(sent[0]), {"model": "m"})
+        self.assertEqual(json.loads(sent[1]), payload)
+
     def test_retries_on_timeout(self) -> None:
         call_count = 0
 